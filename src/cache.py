@@ -1,9 +1,22 @@
 import os
 import json
 
-from typing import List
+from typing import List, Iterator
+from contextlib import contextmanager
 from config import ROOT_DIR
 
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def get_cache_path() -> str:
     """
     Gets the path to the cache file.
@@ -31,6 +44,27 @@ def get_twitter_cache_path() -> str:
     """
     return os.path.join(get_cache_path(), 'twitter.json')
 
+def get_twitter_posts_path(account_uuid: str) -> str:
+    """
+    Gets the path to the post file of a Twitter account.
+
+    Args:
+        account_uuid (str): The account UUID
+
+    Returns:
+        path (str): The path to the account's post file
+    """
+    return os.path.join(get_cache_path(), f'{account_uuid}.jsonl')
+
+def get_twitter_rate_limit_path() -> str:
+    """
+    Gets the path to the Twitter rate limit state file.
+
+    Returns:
+        path (str): The path to the Twitter rate limit file
+    """
+    return os.path.join(get_cache_path(), 'twitter_rate_limit.json')
+
 def get_youtube_cache_path() -> str:
     """
     Gets the path to the YouTube cache file.
@@ -40,6 +74,125 @@ def get_youtube_cache_path() -> str:
     """
     return os.path.join(get_cache_path(), 'youtube.json')
 
+@contextmanager
+def locked_file(path: str) -> Iterator[None]:
+    """
+    Holds an exclusive lock on a file for the duration of the block,
+    waiting for other processes to release it first.
+
+    Args:
+        path (str): The path to the lock file
+
+    Returns:
+        None
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT)
+    locked = False
+
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after about 10 s, keep waiting
+                    continue
+
+        locked = True
+
+        yield
+    finally:
+        # Only unlock what we actually locked
+        if locked:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+        os.close(fd)
+
+def json_dumps(obj: any, indent: bool = False) -> bytes:
+    """
+    Serializes an object to UTF-8 JSON, using orjson if it is installed.
+    Both produce the same format, so files written by either read back
+    the same on every platform.
+
+    Args:
+        obj (any): The object to serialize
+        indent (bool): Whether to pretty-print with 2 spaces
+
+    Returns:
+        data (bytes): The JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+def json_loads(data: bytes) -> any:
+    """
+    Parses a UTF-8 JSON document, using orjson if it is installed.
+
+    Args:
+        data (bytes): The JSON document
+
+    Returns:
+        obj (any): The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data.decode("utf-8"))
+
+def _read_cache(cache_path: str) -> dict:
+    """
+    Reads an accounts cache file.
+
+    Args:
+        cache_path (str): The path to the cache file
+
+    Returns:
+        cache (dict): The parsed cache, empty if the file doesn't exist
+    """
+    if not os.path.exists(cache_path):
+        return {
+            "accounts": []
+        }
+
+    with open(cache_path, 'rb') as file:
+        parsed = json_loads(file.read())
+
+    if parsed is None:
+        parsed = {}
+
+    if 'accounts' not in parsed:
+        parsed['accounts'] = []
+
+    return parsed
+
+def _write_cache(cache_path: str, cache: dict) -> None:
+    """
+    Writes a cache file through a temporary file, so readers never see
+    a half-written cache.
+
+    Args:
+        cache_path (str): The path to the cache file
+        cache (dict): The cache to write
+
+    Returns:
+        None
+    """
+    tmp_path = cache_path + ".tmp"
+
+    # Same format as the Twitter bot writes the cache in
+    with open(tmp_path, 'wb') as file:
+        file.write(json_dumps(cache, indent=True))
+
+    os.replace(tmp_path, cache_path)
+
 def get_accounts(provider: str) -> List[dict]:
     """
     Gets the accounts from the cache.
@@ -59,22 +212,14 @@ def get_accounts(provider: str) -> List[dict]:
 
     if not os.path.exists(cache_path):
         # Create the cache file
-        with open(cache_path, 'w') as file:
-            json.dump({
-                "accounts": []
-            }, file, indent=4)
+        with locked_file(cache_path + ".lock"):
+            if not os.path.exists(cache_path):
+                _write_cache(cache_path, {
+                    "accounts": []
+                })
 
-    with open(cache_path, 'r') as file:
-        parsed = json.load(file)
-
-        if parsed is None:
-            return []
-        
-        if 'accounts' not in parsed:
-            return []
-
-        # Get accounts dictionary
-        return parsed['accounts']
+    # Get accounts dictionary
+    return _read_cache(cache_path)['accounts']
 
 def add_account(provider: str, account: dict) -> None:
     """
@@ -87,29 +232,22 @@ def add_account(provider: str, account: dict) -> None:
         None
     """
     if provider == "twitter":
-        # Get the current accounts
-        accounts = get_accounts("twitter")
-
-        # Add the new account
-        accounts.append(account)
-
-        # Write the new accounts to the cache
-        with open(get_twitter_cache_path(), 'w') as file:
-            json.dump({
-                "accounts": accounts
-            }, file, indent=4)
+        cache_path = get_twitter_cache_path()
     elif provider == "youtube":
+        cache_path = get_youtube_cache_path()
+    else:
+        return
+
+    # Hold the lock the bots use, so their cache writes can't drop the account
+    with locked_file(cache_path + ".lock"):
         # Get the current accounts
-        accounts = get_accounts("youtube")
+        cache = _read_cache(cache_path)
 
         # Add the new account
-        accounts.append(account)
+        cache['accounts'].append(account)
 
         # Write the new accounts to the cache
-        with open(get_youtube_cache_path(), 'w') as file:
-            json.dump({
-                "accounts": accounts
-            }, file, indent=4)
+        _write_cache(cache_path, cache)
 
 def remove_account(account_id: str) -> None:
     """
@@ -121,17 +259,17 @@ def remove_account(account_id: str) -> None:
     Returns:
         None
     """
-    # Get the current accounts
-    accounts = get_accounts()
+    cache_path = get_twitter_cache_path()
 
-    # Remove the account
-    accounts = [account for account in accounts if account['id'] != account_id]
+    with locked_file(cache_path + ".lock"):
+        # Get the current accounts
+        cache = _read_cache(cache_path)
 
-    # Write the new accounts to the cache
-    with open(get_twitter_cache_path(), 'w') as file:
-        json.dump({
-            "accounts": accounts
-        }, file, indent=4)
+        # Remove the account
+        cache['accounts'] = [account for account in cache['accounts'] if account['id'] != account_id]
+
+        # Write the new accounts to the cache
+        _write_cache(cache_path, cache)
 
 def get_products() -> List[dict]:
     """
@@ -3,13 +3,10 @@ import g4f
 from status import *
 from config import *
 from constants import *
-from .Twitter import Twitter
+from .Twitter import Twitter, _DriverPool
 from selenium_firefox import *
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.firefox.service import Service
-from selenium.webdriver.firefox.options import Options
-from webdriver_manager.firefox import GeckoDriverManager
 
 class AffiliateMarketing:
     """
@@ -31,22 +28,10 @@ class AffiliateMarketing:
         """
         self._fp_profile_path: str = fp_profile_path
 
-        # Initialize the Firefox profile
-        self.options: Options = Options()
-
-        # Set headless state of browser
-        if get_headless():
-            self.options.add_argument("--headless")
-
-        # Set the profile path
-        self.options.add_argument("-profile")
-        self.options.add_argument(fp_profile_path)
-        
-        # Set the service
-        self.service: Service = Service(GeckoDriverManager().install())
-
-        # Initialize the browser
-        self.browser: webdriver.Firefox = webdriver.Firefox(service=self.service, options=self.options)
+        # The browser comes from the same pool as the Twitter bot's, since
+        # two browsers can't open the profile in place at once. The pool
+        # also builds the options, so both get the same browser.
+        self.browser: webdriver.Remote = None
 
         # Set the affiliate link
         self.affiliate_link: str = affiliate_link
@@ -68,14 +53,21 @@ class AffiliateMarketing:
         This method will be used to scrape the product
         information from the affiliate link.
         """
-        # Open the affiliate link
-        self.browser.get(self.affiliate_link)
+        self.browser = _DriverPool.acquire(self._fp_profile_path)
 
-        # Get the product name
-        product_title: str = self.browser.find_element(By.ID, AMAZON_PRODUCT_TITLE_ID).text
-        
-        # Get the features of the product
-        features: any = self.browser.find_elements(By.ID, AMAZON_FEATURE_BULLETS_ID)
+        try:
+            # Open the affiliate link
+            self.browser.get(self.affiliate_link)
+
+            # Get the product name
+            product_title: str = self.browser.find_element(By.ID, AMAZON_PRODUCT_TITLE_ID).text
+
+            # Get the features of the product
+            features: any = self.browser.find_elements(By.ID, AMAZON_FEATURE_BULLETS_ID)
+        finally:
+            # Hand the browser back, so share_pitch can reuse it
+            _DriverPool.release(self._fp_profile_path)
+            self.browser = None
 
         if get_verbose():
             info(f"Product Title: {product_title}")
@@ -137,14 +129,13 @@ class AffiliateMarketing:
         """
         if where == "twitter":
             # Initialize the Twitter class
-            twitter: Twitter = Twitter(self.account_uuid, self.account_nickname, self._fp_profile_path, self.topic)
-
-            # Share the pitch
-            twitter.post(self.pitch)
+            with Twitter(self.account_uuid, self.account_nickname, self._fp_profile_path, self.topic) as twitter:
+                # Share the pitch
+                twitter.post(self.pitch)
 
     def quit(self) -> None:
         """
         This method will be used to quit the browser.
         """
-        # Quit the browser
-        self.browser.quit()
+        # Quit the pooled browser for this profile
+        _DriverPool.discard(self._fp_profile_path)
@@ -1,15 +1,21 @@
-import re
 import g4f
 import sys
 import time
 import os
+import glob
 import json
+import platform
+import atexit
+import asyncio
+import threading
 
 from cache import *
 from config import *
 from status import *
 from constants import *
-from typing import List
+from typing import List, Tuple, Optional, Iterator, BinaryIO, ContextManager
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from termcolor import colored
 from selenium_firefox import *
@@ -22,12 +28,452 @@ from selenium.webdriver.firefox.options import Options
 from webdriver_manager.firefox import GeckoDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection
+
+# Characters stripped from generated posts
+_STRIP_TABLE = str.maketrans("", "", '*"')
+
+# Inserts text into a focused contenteditable the way a paste would, so
+# the composer's editor state picks it up
+_INSERT_TEXT_JS = """
+arguments[0].focus();
+return document.execCommand("insertText", false, arguments[1]);
+"""
+
+# Finds the composer, inserts the text and clicks the Tweet button once it
+# is enabled, all in-page. Reports back "posted", which step timed out, or
+# whether it failed before ("error") or after ("error_after_insert") the
+# text was inserted.
+_POST_JS = """
+const [boxSelector, buttonSelector, text, timeout, done] = arguments;
+const deadline = Date.now() + timeout;
+let inserted = false;
+
+function fail() {
+    done(inserted ? "error_after_insert" : "error");
+}
+
+function poll(find, next, failure) {
+    try {
+        const element = find();
+        if (element) {
+            next(element);
+        } else if (Date.now() > deadline) {
+            done(failure);
+        } else {
+            setTimeout(() => poll(find, next, failure), 50);
+        }
+    } catch (e) {
+        fail();
+    }
+}
+
+poll(() => document.querySelector(boxSelector), (box) => {
+    box.focus();
+    inserted = document.execCommand("insertText", false, text);
+    if (!inserted) {
+        done("no_insert");
+        return;
+    }
+
+    poll(() => {
+        const button = document.querySelector(buttonSelector);
+        return button && button.getAttribute("aria-disabled") !== "true" ? button : null;
+    }, (button) => {
+        button.click();
+        done("posted");
+    }, "no_button");
+}, "no_composer");
+"""
+
+def _advise_sequential(file: BinaryIO) -> None:
+    """
+    Tells the kernel a file is about to be read front to back, so it can
+    read ahead more aggressively. Does nothing where posix_fadvise is
+    unavailable (e.g. Windows, macOS).
+
+    Args:
+        file (BinaryIO): The opened file
+
+    Returns:
+        None
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+def _staged_posts_path(account_uuid: str) -> str:
+    """
+    Gets the path a migrated post file is staged at before it replaces the
+    account's post file. Keeps the .jsonl suffix so rem_temp_files leaves
+    it alone.
+
+    Args:
+        account_uuid (str): The account UUID
+
+    Returns:
+        path (str): The staged post file path
+    """
+    return get_twitter_posts_path(account_uuid)[:-len(".jsonl")] + ".migrating.jsonl"
+
+class _TokenBucket:
+    """
+    Token bucket rate limiter. Callers block until a token is available,
+    so requests are paced instead of running into the remote rate limit.
+    If a state file is given, the bucket is persisted there so a fresh
+    process doesn't start with a full bucket.
+    """
+    def __init__(self, capacity: int, refill_per_sec: float, state_path: str = None) -> None:
+        """
+        Initializes the token bucket.
+
+        Args:
+            capacity (int): The maximum amount of tokens
+            refill_per_sec (float): The amount of tokens added per second
+            state_path (str): Optional file to persist the bucket in
+
+        Returns:
+            None
+        """
+        self.capacity: int = capacity
+        self.refill_per_sec: float = refill_per_sec
+        self._state_path: str = state_path
+        self._lock: threading.Lock = threading.Lock()
+        self._tokens: float = float(capacity)
+        self._updated: float = time.time()
+
+    def _load_state(self) -> None:
+        """
+        Loads the bucket from the state file, if there is one.
+
+        Returns:
+            None
+        """
+        if self._state_path is None or not os.path.exists(self._state_path):
+            return
+
+        try:
+            with open(self._state_path, "rb") as file:
+                state = json_loads(file.read())
+
+            self._tokens = min(float(state["tokens"]), self.capacity)
+            self._updated = float(state["updated"])
+        except (ValueError, KeyError, TypeError):
+            # Corrupt state file, keep the in-memory bucket
+            pass
+
+    def _save_state(self) -> None:
+        """
+        Writes the bucket to the state file, if there is one.
+
+        Returns:
+            None
+        """
+        if self._state_path is None:
+            return
+
+        tmp_path = self._state_path + ".tmp"
+
+        with open(tmp_path, "wb") as file:
+            file.write(json_dumps({
+                "tokens": self._tokens,
+                "updated": self._updated
+            }))
+
+        os.replace(tmp_path, self._state_path)
+
+    def _locked_state(self) -> ContextManager[None]:
+        """
+        Locks the state file against other processes, so two of them can't
+        spend the same token.
+
+        Returns:
+            lock (ContextManager[None]): The held lock
+        """
+        if self._state_path is None:
+            return nullcontext()
+
+        return locked_file(self._state_path + ".lock")
+
+    def acquire(self) -> None:
+        """
+        Takes a token from the bucket, waiting until one is available.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            while True:
+                with self._locked_state():
+                    self._load_state()
+
+                    now = time.time()
+                    self._tokens = min(self.capacity, self._tokens + max(0.0, now - self._updated) * self.refill_per_sec)
+                    self._updated = now
+
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._save_state()
+                        return
+
+                # Don't hold the file lock while waiting for a refill
+                time.sleep((1 - self._tokens) / self.refill_per_sec)
+
+class _DriverPool:
+    """
+    Process-wide pool of Firefox WebDrivers, keyed by profile path, so
+    multiple Twitter bots using the same profile share one browser instead
+    of each starting their own.
+    """
+    # Restart a browser after it was handed out this many times
+    MAX_USES_PER_INSTANCE = 50
+
+    _lock: threading.Condition = threading.Condition()
+    _drivers: dict = {}
+    _gecko_path: str = None
+
+    # Serializes resolving the GeckoDriver, webdriver_manager can't install
+    # into ~/.wdm from several threads at once
+    _gecko_lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def _find_cached_gecko() -> str:
+        """
+        Looks for a GeckoDriver previously downloaded by webdriver_manager.
+
+        Returns:
+            path (str): The path to the newest cached GeckoDriver, or None
+        """
+        drivers_dir = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "geckodriver")
+        binary = "geckodriver.exe" if platform.system() == "Windows" else "geckodriver"
+
+        candidates = [
+            path for path in glob.glob(os.path.join(drivers_dir, "**", binary), recursive=True)
+            if os.path.isfile(path) and os.access(path, os.X_OK)
+        ]
+
+        if not candidates:
+            return None
+
+        return max(candidates, key=os.path.getmtime)
+
+    @staticmethod
+    def _options(profile_path: str) -> Options:
+        """
+        Builds the Firefox options for a profile, so every user of a
+        profile gets the same browser no matter who started it.
+
+        Args:
+            profile_path (str): The path to the Firefox profile
+
+        Returns:
+            options (Options): The Firefox options
+        """
+        options: Options = Options()
+
+        # Set headless state if configured
+        if get_headless():
+            options.add_argument("--headless")
+
+        # Use the Firefox profile in place instead of letting FirefoxProfile
+        # copy it to a temporary directory on every start. Don't set prefs
+        # here, GeckoDriver would write them into the user's real profile.
+        options.add_argument("-profile")
+        options.add_argument(profile_path)
+
+        return options
+
+    @classmethod
+    def _create(cls, options: Options) -> Tuple[webdriver.Remote, Service]:
+        """
+        Starts a new Firefox WebDriver.
+
+        Args:
+            options (Options): The Firefox options
+
+        Returns:
+            driver (Tuple[webdriver.Remote, Service]): The new driver, and the GeckoDriver service
+                            the pool has to stop itself
+        """
+        # Only resolve the GeckoDriver once per process, and only ask
+        # webdriver_manager (which checks GitHub) if none is downloaded yet
+        with cls._gecko_lock:
+            if cls._gecko_path is None:
+                cls._gecko_path = cls._find_cached_gecko() or GeckoDriverManager().install()
+
+        service: Service = Service(cls._gecko_path)
+
+        # webdriver.Firefox always uses a connection pool of size 1. Start
+        # GeckoDriver ourselves and connect with a larger pool, so
+        # concurrent commands don't queue up behind each other. This relies
+        # on ClientConfig as of Selenium 4.27, the minimum version pinned in
+        # requirements.txt; re-check it when raising the pin.
+        service.start()
+
+        try:
+            # Selenium reads the pool arguments from a nested key, and only
+            # applies its default 120 s timeout without a client config
+            client_config = ClientConfig(
+                remote_server_addr=service.service_url,
+                timeout=120,
+                init_args_for_pool_manager={
+                    "init_args_for_pool_manager": {"maxsize": get_selenium_pool_size()}
+                }
+            )
+            executor = FirefoxRemoteConnection(
+                service.service_url,
+                client_config=client_config
+            )
+
+            return webdriver.Remote(command_executor=executor, options=options), service
+        except Exception:
+            service.stop()
+            raise
+
+    @staticmethod
+    def _quit(entry: dict) -> None:
+        """
+        Quits a pooled driver (and its service), only warning if that fails.
+
+        Args:
+            entry (dict): The pool entry of the driver
+
+        Returns:
+            None
+        """
+        try:
+            entry["driver"].quit()
+        except Exception as e:
+            warning(f"Failed to quit browser: {str(e)}")
+
+        if entry.get("service") is not None:
+            entry["service"].stop()
+
+    @classmethod
+    def acquire(cls, profile_path: str) -> webdriver.Remote:
+        """
+        Checks out the driver for a profile, starting it if needed. Blocks
+        while another bot is using the driver.
+
+        Args:
+            profile_path (str): The path to the Firefox profile
+
+        Returns:
+            driver (webdriver.Remote): The driver
+        """
+        with cls._lock:
+            while profile_path in cls._drivers and cls._drivers[profile_path]["in_use"]:
+                cls._lock.wait()
+
+            entry = cls._drivers.setdefault(profile_path, {
+                "driver": None,
+                "service": None,
+                "in_use": False,
+                "uses": 0
+            })
+            entry["in_use"] = True
+
+        # The entry is ours now, and starting or quitting a browser takes
+        # seconds, so do it without blocking other profiles
+        try:
+            # Recycle worn out browsers
+            if entry["driver"] is not None and entry["uses"] >= cls.MAX_USES_PER_INSTANCE:
+                cls._quit(entry)
+                entry["driver"] = None
+
+            if entry["driver"] is None:
+                entry["driver"], entry["service"] = cls._create(cls._options(profile_path))
+                entry["uses"] = 0
+        except Exception:
+            cls.release(profile_path)
+            raise
+
+        entry["uses"] += 1
+
+        return entry["driver"]
+
+    @classmethod
+    def release(cls, profile_path: str) -> None:
+        """
+        Hands a driver back to the pool.
+
+        Args:
+            profile_path (str): The path to the Firefox profile
+
+        Returns:
+            None
+        """
+        with cls._lock:
+            entry = cls._drivers.get(profile_path)
+
+            if entry is not None:
+                entry["in_use"] = False
+                cls._lock.notify_all()
+
+    @classmethod
+    def discard(cls, profile_path: str) -> None:
+        """
+        Quits the driver for a profile, waiting until it is no longer in
+        use, so the profile can be opened by another browser.
+
+        Args:
+            profile_path (str): The path to the Firefox profile
+
+        Returns:
+            None
+        """
+        with cls._lock:
+            while profile_path in cls._drivers and cls._drivers[profile_path]["in_use"]:
+                cls._lock.wait()
+
+            entry = cls._drivers.get(profile_path)
+
+            if entry is None:
+                return
+
+            entry["in_use"] = True
+
+        try:
+            if entry["driver"] is not None:
+                cls._quit(entry)
+        finally:
+            with cls._lock:
+                cls._drivers.pop(profile_path, None)
+                cls._lock.notify_all()
+
+    @classmethod
+    def quit_all(cls) -> None:
+        """
+        Quits all pooled drivers.
+
+        Returns:
+            None
+        """
+        with cls._lock:
+            for entry in cls._drivers.values():
+                if entry["driver"] is not None:
+                    cls._quit(entry)
+
+            cls._drivers.clear()
+            cls._lock.notify_all()
+
+atexit.register(_DriverPool.quit_all)
 
 class Twitter:
     """
     Class for the Bot, that grows a Twitter (X) account.
     """
+    # Limits how fast all bots together may post, created lazily
+    _post_bucket: _TokenBucket = None
+
+    # Guards the shared bucket and cache when bots post from several threads
+    _lock: threading.RLock = threading.RLock()
+
+    # Bots with post summaries not yet written to the cache file, flushed
+    # at exit. Bots leave the set once flushed, so it doesn't keep every
+    # bot ever created alive.
+    _unflushed: set = set()
+
     def __init__(self, account_uuid: str, account_nickname: str, fp_profile_path: str, topic: str) -> None:
         """
         Initializes the Twitter Bot.
@@ -46,81 +492,211 @@ class Twitter:
         self.fp_profile_path: str = fp_profile_path
         self.topic: str = topic
 
-        # Initialize the Firefox options with a profile
-        self.options: Options = Options()
-        
-        # Set headless state if configured
-        if get_headless():
-            self.options.add_argument("--headless")
+        # Config values used on every post, read once
+        self._cache_path: str = get_twitter_cache_path()
+        self._verbose: bool = get_verbose()
+        self._lang: str = get_twitter_language()
+        self._model: any = parse_model(get_model())
 
-        # Set the Firefox profile using FirefoxProfile (preferred method)
-        firefox_profile = FirefoxProfile(fp_profile_path)
-        self.options.profile = firefox_profile
+        # Parsed contents of the Twitter cache, loaded lazily
+        self._cache: dict = None
+        self._accounts_by_id: dict = {}
 
-        # Initialize the GeckoDriver service
-        self.service: Service = Service(GeckoDriverManager().install())
+        # Post summaries not yet written to the cache file
+        self._pending: dict = {}
 
-        # Initialize the Firefox WebDriver
-        self.browser: webdriver.Firefox = webdriver.Firefox(service=self.service, options=self.options)
+    def close(self) -> None:
+        """
+        Writes pending post summaries and quits the pooled browser for this
+        bot's profile, so the profile can be opened by another browser. The
+        next post starts a new one.
 
-    def post(self, text: str = None) -> None:
+        Returns:
+            None
         """
-        Posts generated text (or a provided text) to Twitter (X).
+        self.flush()
+        _DriverPool.discard(self.fp_profile_path)
+
+    def __enter__(self) -> "Twitter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _wait(self, bot: webdriver.Remote, timeout: float) -> WebDriverWait:
+        """
+        Creates a WebDriverWait that polls much more often than the default
+        500 ms, so we continue as soon as the page is ready.
 
         Args:
-            text (str): Optional text to post. If None, a generated post will be used.
+            bot (webdriver.Remote): The checked out browser
+            timeout (float): The timeout in seconds
 
         Returns:
-            None
+            wait (WebDriverWait): The wait
         """
-        bot: webdriver.Firefox = self.browser
-        verbose: bool = get_verbose()
+        return WebDriverWait(
+            bot,
+            timeout,
+            poll_frequency=TWITTER_WAIT_POLL_FREQUENCY,
+            ignored_exceptions=(exceptions.NoSuchElementException, exceptions.StaleElementReferenceException)
+        )
 
-        # Navigate directly to x.com/home
-        bot.get("https://x.com")
-        time.sleep(2)
+    def _composer_is_empty(self, bot: webdriver.Remote) -> bool:
+        """
+        Checks that no text has been entered into the composer.
 
-        # Generate or use provided post content
-        post_content: str = self.generate_post() if text is None else text
-        now: datetime = datetime.now()
+        Args:
+            bot (webdriver.Remote): The checked out browser
 
-        print(colored(f" => Posting to Twitter:", "blue"), post_content[:30] + "...")
+        Returns:
+            empty (bool): False if the composer has text or can't be checked
+        """
+        try:
+            tweet_boxes = bot.find_elements(By.CSS_SELECTOR, TWITTER_TWEET_BOX_SELECTOR)
+
+            return all(tweet_box.text == "" for tweet_box in tweet_boxes)
+        except exceptions.WebDriverException:
+            return False
 
+    def _post_with_selenium(self, bot: webdriver.Remote, post_content: str) -> bool:
+        """
+        Composes and sends a post through individual Selenium commands.
+
+        Args:
+            bot (webdriver.Remote): The checked out browser
+            post_content (str): The text to post
+
+        Returns:
+            success (bool): Whether the Tweet button was clicked
+        """
         try:
+            # Wait for the Home feed to render the composer
+            self._wait(bot, 10).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, TWITTER_TWEET_BOX_SELECTOR)
+                )
+            )
+
             # 1) Locate the visible text area for composing a new post
             #    This is typically data-testid='tweetTextarea_0' if you're logged in and on Home
-            tweet_box = WebDriverWait(bot, 10).until(
+            tweet_box = self._wait(bot, 5).until(
                 EC.visibility_of_element_located(
-                    (By.CSS_SELECTOR, "div[data-testid='tweetTextarea_0']")
+                    (By.CSS_SELECTOR, TWITTER_TWEET_BOX_SELECTOR)
                 )
             )
 
             # Click into the composer to ensure focus (sometimes needed)
             tweet_box.click()
 
-            # 2) Enter your text into the composer
-            tweet_box.send_keys(post_content)
+            # 2) Enter your text into the composer in one command, typing
+            #    it key by key only if the browser refuses the insert
+            if not bot.execute_script(_INSERT_TEXT_JS, tweet_box, post_content):
+                tweet_box.send_keys(post_content)
 
         except exceptions.TimeoutException:
             print("Timeout: Unable to locate the tweet input box on the Home feed.")
-            return
+            return False
 
         # 3) Locate the inline Tweet button (data-testid='tweetButtonInline') and click
         try:
-            tweet_button = WebDriverWait(bot, 10).until(
+            tweet_button = self._wait(bot, 10).until(
                 EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "div[data-testid='tweetButtonInline']")
+                    (By.CSS_SELECTOR, TWITTER_TWEET_BUTTON_SELECTOR)
                 )
             )
             tweet_button.click()
         except exceptions.TimeoutException:
+            print("Timeout: Unable to find or click the Tweet button.")
+            return False
+
+        return True
+
+    def post(self, text: str = None) -> None:
+        """
+        Posts generated text (or a provided text) to Twitter (X).
+
+        Args:
+            text (str): Optional text to post. If None, a generated post will be used.
+
+        Returns:
+            None
+        """
+        # Wait for our turn instead of running into X's rate limit
+        self._get_post_bucket().acquire()
+
+        # Only hold the profile's browser for the duration of the post, so
+        # other bots on the same profile can use it in between. The driver
+        # is passed along instead of stored on the bot, since the same bot
+        # may post from several threads.
+        bot: webdriver.Remote = _DriverPool.acquire(self.fp_profile_path)
+
+        try:
+            self._post(bot, text)
+        finally:
+            _DriverPool.release(self.fp_profile_path)
+
+    def _post(self, bot: webdriver.Remote, text: str = None) -> None:
+        """
+        Posts using the checked out browser.
+
+        Args:
+            bot (webdriver.Remote): The checked out browser
+            text (str): Optional text to post. If None, a generated post will be used.
+
+        Returns:
+            None
+        """
+        verbose: bool = self._verbose
+
+        # Navigate directly to x.com/home
+        bot.get("https://x.com")
+
+        # Generate or use provided post content
+        post_content: str = self.generate_post() if text is None else text
+        now: datetime = datetime.now()
+
+        print(colored(f" => Posting to Twitter:", "blue"), post_content[:30] + "...")
+
+        # Compose and send the post in a single script call
+        try:
+            status: str = bot.execute_async_script(
+                _POST_JS,
+                TWITTER_TWEET_BOX_SELECTOR,
+                TWITTER_TWEET_BUTTON_SELECTOR,
+                post_content,
+                10000
+            )
+        except exceptions.WebDriverException:
+            # E.g. a script timeout, which may have hit after the insert
+            status = "error" if self._composer_is_empty(bot) else "error_after_insert"
+
+        if status == "no_composer":
+            print("Timeout: Unable to locate the tweet input box on the Home feed.")
+            return
+        elif status == "no_button":
             print("Timeout: Unable to find or click the Tweet button.")
             return
+        elif status == "error_after_insert":
+            # Retrying now would insert the text a second time
+            print("Error: Failed to send the post after entering its text.")
+            return
+        elif status != "posted":
+            # The script failed before touching the composer, drive the
+            # page step by step instead
+            if not self._post_with_selenium(bot, post_content):
+                return
 
         if verbose:
             print(colored(" => Clicked the Tweet button on X (Home composer).", "blue"))
 
-        time.sleep(4)
+        # Wait until X has sent the post and cleared the composer
+        try:
+            self._wait(bot, 10).until(
+                lambda d: d.find_element(By.CSS_SELECTOR, TWITTER_TWEET_BOX_SELECTOR).text == ""
+            )
+        except exceptions.TimeoutException:
+            warning("Timeout: The composer was not cleared, the post may not have been sent.")
 
         # Add the posted content to the local cache
         self.add_post({
@@ -130,6 +706,282 @@ class Twitter:
 
         success("Posted to Twitter successfully!")
 
+    def _get_post_bucket(self) -> _TokenBucket:
+        """
+        Gets the rate limiter shared by all Twitter bots in this process,
+        creating it on first use.
+
+        Returns:
+            bucket (_TokenBucket): The post rate limiter
+        """
+        with Twitter._lock:
+            if Twitter._post_bucket is None:
+                Twitter._post_bucket = _TokenBucket(
+                    TWITTER_POST_RATE_LIMIT,
+                    TWITTER_POST_RATE_LIMIT / TWITTER_POST_RATE_WINDOW,
+                    get_twitter_rate_limit_path()
+                )
+
+        return Twitter._post_bucket
+
+    def _locked_cache(self) -> ContextManager[None]:
+        """
+        Locks the Twitter cache and post files against other processes. Must
+        be held while reading or writing them, and is not re-entrant.
+
+        Returns:
+            lock (ContextManager[None]): The held lock
+        """
+        return locked_file(self._cache_path + ".lock")
+
+    def _read_cache_file(self) -> dict:
+        """
+        Reads and parses the Twitter cache file, creating it if needed.
+
+        Returns:
+            cache (dict): The parsed cache
+        """
+        if not os.path.exists(self._cache_path):
+            # Create the cache file if it doesn't exist
+            cache = {
+                "accounts": []
+            }
+            self._write_cache_file(cache)
+            return cache
+
+        with open(self._cache_path, 'rb') as file:
+            _advise_sequential(file)
+            cache = json_loads(file.read())
+
+        # Ensure 'accounts' exists
+        if "accounts" not in cache:
+            cache["accounts"] = []
+
+        return cache
+
+    def _write_cache_file(self, cache: dict) -> None:
+        """
+        Writes the cache to disk. The cache is written to a temporary file
+        first and then moved into place, so a crash mid-write never leaves
+        a truncated cache behind.
+
+        Args:
+            cache (dict): The cache to write
+
+        Returns:
+            None
+        """
+        tmp_path = self._cache_path + ".tmp"
+
+        with open(tmp_path, "wb") as file:
+            file.write(json_dumps(cache, indent=True))
+
+        os.replace(tmp_path, self._cache_path)
+
+    def _load_cache(self) -> dict:
+        """
+        Loads the Twitter cache into memory. Accounts that still keep their
+        posts inline in the cache file are migrated to post files first.
+        Subsequent calls return the already parsed cache.
+
+        Returns:
+            cache (dict): The parsed cache
+        """
+        if self._cache is not None:
+            return self._cache
+
+        self._cache = self._read_cache_file()
+        self._index_accounts()
+
+        legacy_accounts = [
+            account for account in self._cache["accounts"] if "posts" in account
+        ]
+
+        for account in legacy_accounts:
+            self._migrate_posts(account)
+
+        if legacy_accounts:
+            self._write_cache_file(self._cache)
+
+        # The staged post files only replace the real ones once the cache no
+        # longer holds the inline posts, so a crash in between can neither
+        # lose nor duplicate posts
+        for account in self._cache["accounts"]:
+            self._finish_migration(account["id"])
+
+        return self._cache
+
+    def _finish_migration(self, account_uuid: str) -> None:
+        """
+        Moves an account's staged post file into place, if a migration left
+        one behind. Must be called under the cache lock before the post file
+        is touched, since the staged file replaces it.
+
+        Args:
+            account_uuid (str): The account UUID
+
+        Returns:
+            None
+        """
+        staged_path = _staged_posts_path(account_uuid)
+
+        if os.path.exists(staged_path):
+            os.replace(staged_path, get_twitter_posts_path(account_uuid))
+
+    def _migrate_posts(self, account: dict) -> None:
+        """
+        Stages an account's inline posts, in front of any posts already in
+        its post file, and replaces them with a summary. The staged file is
+        moved into place by _finish_migration after the cache has been
+        written.
+
+        Args:
+            account (dict): The cached account
+
+        Returns:
+            None
+        """
+        posts = account.pop("posts")
+        posts_path = get_twitter_posts_path(account["id"])
+
+        if posts:
+            staged_path = _staged_posts_path(account["id"])
+            tmp_path = staged_path + ".tmp"
+
+            with open(tmp_path, "wb") as file:
+                for post in posts:
+                    file.write(json_dumps(post) + b"\n")
+
+                if os.path.exists(posts_path):
+                    with open(posts_path, "rb") as existing:
+                        existing_posts = existing.read()
+
+                    file.write(existing_posts)
+
+                    if existing_posts and not existing_posts.endswith(b"\n"):
+                        file.write(b"\n")
+
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(tmp_path, staged_path)
+
+            account["post_count"] = account.get("post_count", 0) + len(posts)
+            account["last_post"] = posts[-1].get("date")
+
+    def _index_accounts(self) -> None:
+        """
+        Builds the in-memory UUID -> account index over the cached accounts.
+        The index holds references to the same dictionaries as the "accounts"
+        list, so mutations through it are persisted on the next flush.
+
+        Returns:
+            None
+        """
+        self._accounts_by_id = {
+            account["id"]: account for account in self._cache["accounts"]
+        }
+
+    def _apply_summary(self, account_uuid: str, count: int, last_post: str) -> None:
+        """
+        Adds posts to an account's summary in the in-memory cache, creating
+        the account if it is missing.
+
+        Args:
+            account_uuid (str): The account UUID
+            count (int): The amount of posts added
+            last_post (str): The date of the newest added post
+
+        Returns:
+            None
+        """
+        account = self._accounts_by_id.get(account_uuid)
+        if account is None:
+            account = {
+                "id": account_uuid
+            }
+            self._cache["accounts"].append(account)
+            self._accounts_by_id[account_uuid] = account
+
+        account["post_count"] = account.get("post_count", 0) + count
+        account["last_post"] = last_post
+
+    def _flush_cache(self) -> None:
+        """
+        Writes pending post summaries to the cache file. The cache is re-read
+        from disk and only our pending counts are added, so summaries
+        written by other bots are not lost.
+
+        Returns:
+            None
+        """
+        if not self._pending:
+            return
+
+        self._cache = self._read_cache_file()
+        self._index_accounts()
+
+        for account_uuid, pending in self._pending.items():
+            self._apply_summary(account_uuid, pending["count"], pending["last_post"])
+
+        self._write_cache_file(self._cache)
+        self._pending = {}
+        Twitter._unflushed.discard(self)
+
+    def flush(self) -> None:
+        """
+        Forces all pending post summaries to be written to the cache file.
+
+        Returns:
+            None
+        """
+        with Twitter._lock:
+            # Don't take the file lock for nothing
+            if not self._pending:
+                return
+
+            with self._locked_cache():
+                self._flush_cache()
+
+    @classmethod
+    def flush_all(cls) -> None:
+        """
+        Writes the pending post summaries of all bots to the cache file.
+
+        Returns:
+            None
+        """
+        with cls._lock:
+            bots = list(cls._unflushed)
+
+        for bot in bots:
+            bot.flush()
+
+    def _read_posts(self) -> Iterator[dict]:
+        """
+        Lazily reads the posts of this account from its post file.
+
+        Returns:
+            posts (Iterator[dict]): The post dictionaries, oldest first
+        """
+        posts_path = get_twitter_posts_path(self.account_uuid)
+
+        if not os.path.exists(posts_path):
+            return
+
+        with open(posts_path, "rb") as file:
+            _advise_sequential(file)
+
+            for line in file:
+                if not line.strip():
+                    continue
+
+                try:
+                    yield json_loads(line)
+                except ValueError:
+                    # A torn line from an interrupted append
+                    continue
+
     def get_posts(self) -> List[dict]:
         """
         Gets the posts from the cache for this account.
@@ -137,27 +989,20 @@ class Twitter:
         Returns:
             A list of post dictionaries
         """
-        if not os.path.exists(get_twitter_cache_path()):
-            # Create the cache file if it doesn't exist
-            with open(get_twitter_cache_path(), 'w') as file:
-                json.dump({
-                    "posts": [],
-                    "accounts": []
-                }, file, indent=4)
-
-        with open(get_twitter_cache_path(), 'r') as file:
-            parsed = json.load(file)
-
-            # Find our account
-            if "accounts" in parsed:
-                for account in parsed["accounts"]:
-                    if account["id"] == self.account_uuid:
-                        return account.get("posts", [])
-            return []
+        with Twitter._lock, self._locked_cache():
+            self._load_cache()
+
+            # Another process may have crashed mid-migration since we loaded
+            self._finish_migration(self.account_uuid)
+
+            return list(self._read_posts())
 
     def add_post(self, post: dict) -> None:
         """
-        Adds a new post to the cache for this account.
+        Adds a new post to the cache for this account. The post is appended
+        to the account's post file right away, while the account summary in
+        the cache file is only rewritten every few posts, on flush() or at
+        exit.
 
         Args:
             post (dict): The post to add, must contain 'content' and 'date'.
@@ -165,61 +1010,71 @@ class Twitter:
         Returns:
             None
         """
-        posts = self.get_posts()
-        posts.append(post)
+        with Twitter._lock, self._locked_cache():
+            self._load_cache()
 
-        with open(get_twitter_cache_path(), "r") as file:
-            previous_json = json.loads(file.read())
-            
-            # Ensure 'accounts' exists
-            if "accounts" not in previous_json:
-                previous_json["accounts"] = []
+            # Another process may have crashed mid-migration since we
+            # loaded, appending now would be lost when it is finished
+            self._finish_migration(self.account_uuid)
 
-            # Find our account by ID or create if missing
-            account_found = False
-            for account in previous_json["accounts"]:
-                if account["id"] == self.account_uuid:
-                    if "posts" not in account:
-                        account["posts"] = []
-                    account["posts"].append(post)
-                    account_found = True
-                    break
+            with open(get_twitter_posts_path(self.account_uuid), "a+b") as file:
+                line = json_dumps(post) + b"\n"
 
-            if not account_found:
-                previous_json["accounts"].append({
-                    "id": self.account_uuid,
-                    "posts": [post]
-                })
-            
-            # Commit changes
-            with open(get_twitter_cache_path(), "w") as f:
-                f.write(json.dumps(previous_json, indent=4))
+                # Never glue the post onto a torn last line
+                if file.seek(0, os.SEEK_END) > 0:
+                    file.seek(-1, os.SEEK_END)
 
-    def generate_post(self) -> str:
+                    if file.read(1) != b"\n":
+                        line = b"\n" + line
+
+                file.write(line)
+
+            self._apply_summary(self.account_uuid, 1, post.get("date"))
+
+            pending = self._pending.setdefault(self.account_uuid, {"count": 0})
+            pending["count"] += 1
+            pending["last_post"] = post.get("date")
+            Twitter._unflushed.add(self)
+
+            if sum(p["count"] for p in self._pending.values()) >= TWITTER_CACHE_FLUSH_INTERVAL:
+                self._flush_cache()
+
+    def _build_messages(self) -> List[dict]:
         """
-        Generates a short post for the Twitter account based on the self.topic,
-        using a GPT-like AI model via g4f.
+        Builds the prompt used to generate a post.
+
+        Returns:
+            messages (List[dict]): The chat messages for the model
+        """
+        return [
+            {
+                "role": "user",
+                "content": (
+                    f"Generate a Twitter post about: {self.topic} "
+                    f"in {self._lang}. "
+                    f"The limit is 2 sentences. "
+                    f"Choose a specific sub-topic of the provided topic."
+                )
+            }
+        ]
+
+    def _generate_once(self, messages: List[dict]) -> str:
+        """
+        Prompts the model once and cleans up the result.
+
+        Args:
+            messages (List[dict]): The chat messages for the model
 
         Returns:
             (str) Generated post text
         """
         # Prompt the model
         completion = g4f.ChatCompletion.create(
-            model=parse_model(get_model()),
-            messages=[
-                {
-                    "role": "user",
-                    "content": (
-                        f"Generate a Twitter post about: {self.topic} "
-                        f"in {get_twitter_language()}. "
-                        f"The limit is 2 sentences. "
-                        f"Choose a specific sub-topic of the provided topic."
-                    )
-                }
-            ]
+            model=self._model,
+            messages=messages
         )
 
-        if get_verbose():
+        if self._verbose:
             info("Generating a post...")
 
         if completion is None:
@@ -227,13 +1082,112 @@ class Twitter:
             sys.exit(1)
 
         # Clean up the generated text (remove * and any extra quotes)
-        completion = re.sub(r"\*", "", completion).replace("\"", "")
+        completion = completion.translate(_STRIP_TABLE)
 
-        if get_verbose():
+        if self._verbose:
             info(f"Length of post: {len(completion)}")
 
-        # If the post is too long (>= 260 chars), regenerate
-        if len(completion) >= 260:
-            return self.generate_post()
+        return completion
+
+    def _accept_post(self, completion: str, attempt: int) -> Optional[str]:
+        """
+        Checks a generated post against the length limit. Too long posts
+        are rejected so they get regenerated, except on the last attempt,
+        where the post is truncated instead.
+
+        Args:
+            completion (str): The generated post text
+            attempt (int): The zero-based attempt number
+
+        Returns:
+            (str) The post to use, or None to regenerate
+        """
+        if len(completion) < TWITTER_POST_MAX_LENGTH:
+            return completion
+
+        if attempt < TWITTER_POST_MAX_RETRIES - 1:
+            return None
+
+        warning(f"Post still too long after {TWITTER_POST_MAX_RETRIES} attempts, truncating it.")
+
+        return completion[:TWITTER_POST_MAX_LENGTH - 1]
+
+    def generate_post(self) -> str:
+        """
+        Generates a short post for the Twitter account based on the self.topic,
+        using a GPT-like AI model via g4f.
+
+        Returns:
+            (str) Generated post text
+        """
+        messages = self._build_messages()
+
+        for attempt in range(TWITTER_POST_MAX_RETRIES):
+            post = self._accept_post(self._generate_once(messages), attempt)
+
+            if post is not None:
+                return post
+
+    async def generate_post_async(self) -> str:
+        """
+        Same as generate_post, but runs the blocking model call in a worker
+        thread, so several generations can wait on the network at once.
+
+        Returns:
+            (str) Generated post text
+        """
+        messages = self._build_messages()
+
+        for attempt in range(TWITTER_POST_MAX_RETRIES):
+            post = self._accept_post(await asyncio.to_thread(self._generate_once, messages), attempt)
+
+            if post is not None:
+                return post
+
+# Make sure pending summaries end up in the cache file
+atexit.register(Twitter.flush_all)
+
+def generate_posts_bulk(bots: List[Twitter]) -> List[str]:
+    """
+    Generates a post for each bot, running the model calls concurrently.
+
+    Args:
+        bots (List[Twitter]): The bots to generate posts for
+
+    Returns:
+        posts (List[str]): The generated posts, in the same order as the bots
+    """
+    async def gather() -> List[str]:
+        return await asyncio.gather(*[bot.generate_post_async() for bot in bots])
+
+    return asyncio.run(gather())
+
+def post_many(bots: List[Twitter], texts: List[str] = None, max_threads: int = 4) -> None:
+    """
+    Posts from several Twitter bots concurrently.
+
+    Args:
+        bots (List[Twitter]): The bots to post with
+        texts (List[str]): Optional texts to post, one per bot. A None entry (or
+                           no list at all) makes that bot generate its post.
+        max_threads (int): The maximum amount of posts in flight at once
+
+    Returns:
+        None
+    """
+    if texts is None:
+        texts = [None] * len(bots)
+
+    if len(texts) != len(bots):
+        raise ValueError("Expected one text per bot.")
+
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        futures = {
+            executor.submit(bot.post, text): bot for bot, text in zip(bots, texts)
+        }
 
-        return completion
\ No newline at end of file
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                error(f"Failed to post for {futures[future].account_nickname}: {str(e)}")
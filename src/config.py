@@ -69,6 +69,16 @@ def get_headless() -> bool:
     with open(os.path.join(ROOT_DIR, "config.json"), "r") as file:
         return json.load(file)["headless"]
 
+def get_selenium_pool_size() -> int:
+    """
+    Gets the size of the connection pool Selenium uses to talk to the browser.
+
+    Returns:
+        pool_size (int): The connection pool size
+    """
+    with open(os.path.join(ROOT_DIR, "config.json"), "r") as file:
+        return json.load(file).get("selenium_pool_size", 16)
+
 def get_model() -> str:
     """
     Gets the model from the config file.
@@ -5,6 +5,14 @@ import g4f
 
 TWITTER_TEXTAREA_CLASS = "public-DraftStyleDefault-block public-DraftStyleDefault-ltr"
 TWITTER_POST_BUTTON_XPATH = "/html/body/div[1]/div/div/div[2]/main/div/div/div/div[1]/div/div[3]/div/div[2]/div[1]/div/div/div/div[2]/div[2]/div[2]/div/div/div/div[3]"
+TWITTER_TWEET_BOX_SELECTOR = "div[data-testid='tweetTextarea_0']"
+TWITTER_TWEET_BUTTON_SELECTOR = "div[data-testid='tweetButtonInline']"
+TWITTER_WAIT_POLL_FREQUENCY = 0.05
+TWITTER_POST_MAX_LENGTH = 260
+TWITTER_POST_MAX_RETRIES = 5
+TWITTER_POST_RATE_LIMIT = 50
+TWITTER_POST_RATE_WINDOW = 15 * 60
+TWITTER_CACHE_FLUSH_INTERVAL = 10
 
 OPTIONS = [
     "YouTube Shorts Automation",
@@ -31,6 +31,7 @@ def main():
                     acc["topic"]
                 )
                 twitter.post()
+                twitter.close()
                 if verbose:
                     success("Done posting.")
                 break
@@ -204,8 +204,7 @@ def main():
                     "id": generated_uuid,
                     "nickname": nickname,
                     "firefox_profile": fp_profile,
-                    "topic": topic,
-                    "posts": []
+                    "topic": topic
                 })
         else:
             table = PrettyTable()
@@ -297,6 +296,9 @@ def main():
                         if get_verbose():
                             info(" => Climbing Options Ladder...", False)
                         break
+
+                # Quit the browser so the profile is free for other tools
+                twitter.close()
     elif user_input == 3:
         info("Starting Affiliate Marketing...")
 
@@ -53,7 +53,9 @@ def rem_temp_files() -> None:
     files = os.listdir(mp_dir)
 
     for file in files:
-        if not file.endswith(".json"):
+        # Keep caches, Twitter post files and lock files other
+        # processes may be holding
+        if not file.endswith((".json", ".jsonl", ".lock")):
             os.remove(os.path.join(mp_dir, file))
 
 def fetch_songs() -> None: